@@ -0,0 +1,74 @@
+import ast
+import importlib
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from bfcl.model_handler.handler_map import (
+    HANDLER_MODULES,
+    HANDLER_MAP,
+    LazyHandlerMap,
+    api_inference_handler_registry,
+    local_inference_handler_registry,
+    api_inference_handler_map,
+    local_inference_handler_map,
+)
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
+
+class TestHandlerMap(unittest.TestCase):
+    def test_registries_are_consistent(self):
+        for registry in (
+            api_inference_handler_registry,
+            local_inference_handler_registry,
+        ):
+            for model_name, class_name in registry.items():
+                with self.subTest(model=model_name):
+                    self.assertIn(class_name, HANDLER_MODULES)
+
+        # A model in both registries would be silently overwritten in HANDLER_MAP.
+        shared = (
+            api_inference_handler_registry.keys()
+            & local_inference_handler_registry.keys()
+        )
+        self.assertFalse(shared, f"Models listed in both registries: {sorted(shared)}")
+        self.assertEqual(
+            set(HANDLER_MAP),
+            set(api_inference_handler_map) | set(local_inference_handler_map),
+        )
+
+    def test_handler_modules_define_their_class(self):
+        # Static check, so a wrong module path or class name is caught even when the
+        # provider SDKs are not installed.
+        for class_name, module_path in HANDLER_MODULES.items():
+            with self.subTest(handler=class_name):
+                source_file = PACKAGE_ROOT / (module_path.replace(".", "/") + ".py")
+                self.assertTrue(source_file.is_file(), f"{source_file} does not exist")
+                tree = ast.parse(source_file.read_text(encoding="utf-8"))
+                defined = {
+                    node.name for node in tree.body if isinstance(node, ast.ClassDef)
+                }
+                self.assertIn(class_name, defined)
+
+    def test_handler_modules_resolve(self):
+        for class_name, module_path in HANDLER_MODULES.items():
+            with self.subTest(handler=class_name):
+                try:
+                    module = importlib.import_module(module_path)
+                except ModuleNotFoundError as e:
+                    # A missing handler module is a bug; a missing provider SDK is not.
+                    if e.name and e.name.startswith("bfcl"):
+                        raise
+                    self.skipTest(f"{module_path} needs {e.name}")
+                self.assertTrue(hasattr(module, class_name))
+
+    def test_misnamed_handler_class_is_reported(self):
+        lazy_map = LazyHandlerMap({"some-model": "NoSuchHandler"})
+        with mock.patch.dict(HANDLER_MODULES, {"NoSuchHandler": "collections"}):
+            with self.assertRaisesRegex(ImportError, "NoSuchHandler.*some-model"):
+                lazy_map["some-model"]
+
+
+if __name__ == "__main__":
+    unittest.main()